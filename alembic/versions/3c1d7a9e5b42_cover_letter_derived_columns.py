@@ -0,0 +1,76 @@
+"""Add cover letter derived columns, preview cache and keyset index
+
+Revision ID: 3c1d7a9e5b42
+Revises:
+Create Date: 2026-10-16 20:16:34.000000
+
+Brings cover_letters tables created before these columns existed in line
+with app.models.cover_letter. create_all never alters existing tables, so
+the statements are written to be safe on databases that already have them.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d7a9e5b42'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expression as app.models.cover_letter._COMPLETENESS_SQL, frozen here so
+# later model edits do not change what this revision does
+COMPLETENESS_SQL = r"""20 * (
+    (CASE WHEN COALESCE(job_title, '') <> '' AND COALESCE(company_name, '') <> '' THEN 1 ELSE 0 END)
+    + (CASE WHEN COALESCE(content->>'opening_paragraph', '') ~ '\S' THEN 1 ELSE 0 END)
+    + (CASE WHEN jsonb_path_exists(content, '$.body_paragraphs[*] ? (@ like_regex "\\S")') THEN 1 ELSE 0 END)
+    + (CASE WHEN COALESCE(content->>'closing_paragraph', '') ~ '\S' THEN 1 ELSE 0 END)
+    + (CASE WHEN COALESCE(hiring_manager_name, '') <> '' THEN 1 ELSE 0 END)
+)"""
+
+# Counts whitespace-separated words in opening, body and closing paragraphs,
+# matching app.models.cover_letter.count_content_words
+WORD_COUNT_SQL = r"""(
+    SELECT count(*)
+    FROM regexp_matches(
+        concat_ws(
+            ' ',
+            content->>'opening_paragraph',
+            CASE WHEN jsonb_typeof(content->'body_paragraphs') = 'array' THEN (
+                SELECT string_agg(paragraph, ' ')
+                FROM jsonb_array_elements_text(content->'body_paragraphs') AS paragraph
+            ) END,
+            content->>'closing_paragraph'
+        ),
+        '\S+',
+        'g'
+    )
+)"""
+
+
+def upgrade() -> None:
+    # A plain completeness_percentage column cannot be converted in place, so rebuild it
+    op.execute("ALTER TABLE cover_letters DROP COLUMN IF EXISTS completeness_percentage")
+    op.execute(
+        "ALTER TABLE cover_letters ADD COLUMN completeness_percentage INTEGER "
+        f"GENERATED ALWAYS AS ({COMPLETENESS_SQL}) STORED"
+    )
+
+    op.execute("ALTER TABLE cover_letters ADD COLUMN IF NOT EXISTS word_count INTEGER NOT NULL DEFAULT 0")
+    op.execute(f"UPDATE cover_letters SET word_count = {WORD_COUNT_SQL}")
+
+    op.execute("ALTER TABLE cover_letters ADD COLUMN IF NOT EXISTS preview_html TEXT")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cover_letters_user_updated_id "
+        "ON cover_letters (user_id, updated_at, id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_cover_letters_user_updated_id")
+    op.execute("ALTER TABLE cover_letters DROP COLUMN IF EXISTS preview_html")
+    op.execute("ALTER TABLE cover_letters DROP COLUMN IF EXISTS word_count")
+    op.execute("ALTER TABLE cover_letters DROP COLUMN IF EXISTS completeness_percentage")
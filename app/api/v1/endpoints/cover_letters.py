@@ -49,6 +49,7 @@ async def list_cover_letters(
         size: int = Query(10, ge=1, le=100, description="Items per page"),
         is_active: Optional[bool] = Query(None, description="Filter by active status"),
         company_name: Optional[str] = Query(None, description="Filter by company name"),
+        cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
         current_user: dict = Depends(get_current_active_user),
         db: Session = Depends(get_db)
 ):
@@ -60,7 +61,13 @@ async def list_cover_letters(
             page=page,
             size=size,
             is_active=is_active,
-            company_name=company_name
+            company_name=company_name,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         logger.error(f"Error listing cover letters: {e}")
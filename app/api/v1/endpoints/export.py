@@ -3,7 +3,7 @@ from fastapi.responses import StreamingResponse
 from uuid import UUID
 from io import BytesIO
 
-from app.services.export_service import ExportService
+from app.services.export_service import get_export_service
 from app.schemas.response import SuccessResponse
 from app.core.dependencies import get_current_active_user
 
@@ -14,7 +14,7 @@ router = APIRouter()
 async def get_supported_formats():
     """Get list of supported export formats"""
     try:
-        service = ExportService()
+        service = get_export_service()
         formats = service.get_supported_formats()
 
         return SuccessResponse(data={
@@ -35,7 +35,7 @@ async def get_export_status(
 ):
     """Get the status of an export job"""
     try:
-        service = ExportService()
+        service = get_export_service()
         job_status = service.get_export_status(export_id)
 
         if not job_status:
@@ -68,7 +68,7 @@ async def download_export(
 ):
     """Download the exported file"""
     try:
-        service = ExportService()
+        service = get_export_service()
 
         # Check export status first
         job_status = service.get_export_status(export_id)
@@ -149,7 +149,7 @@ async def delete_export(
 ):
     """Delete an export job and its associated file"""
     try:
-        service = ExportService()
+        service = get_export_service()
 
         # Check export status first
         job_status = service.get_export_status(export_id)
@@ -195,7 +195,7 @@ async def get_export_stats(
 ):
     """Get export statistics for the current user"""
     try:
-        service = ExportService()
+        service = get_export_service()
         stats = service.get_export_statistics(current_user["id"])
 
         return SuccessResponse(data=stats)
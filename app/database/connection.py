@@ -3,11 +3,18 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import logging
+import orjson
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON/JSONB column values with orjson (the driver expects str, not bytes)"""
+    return orjson.dumps(obj).decode('utf-8')
+
+
 # Database engine configuration
 if settings.environment == "test":
     # Use SQLite for testing
@@ -16,6 +23,8 @@ if settings.environment == "test":
         SQLALCHEMY_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
         echo=settings.debug
     )
 else:
@@ -26,6 +35,8 @@ else:
         pool_size=10,
         max_overflow=20,
         pool_recycle=3600,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
         echo=settings.debug
     )
 
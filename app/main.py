@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -13,6 +13,7 @@ from datetime import datetime
 from app.core.config import settings
 from app.api.v1.router import api_router
 from app.database.connection import create_tables, db_manager
+from app.services.export_service import shutdown_export_service
 from app.schemas.response import HealthCheckResponse, ErrorResponse
 
 # Configure logging
@@ -48,6 +49,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info(f"Shutting down {settings.service_name}")
+    shutdown_export_service()
 
 
 # Create FastAPI application
@@ -58,7 +60,8 @@ app = FastAPI(
     lifespan=lifespan,
     debug=settings.debug,
     docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None
+    redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiting
@@ -1,12 +1,39 @@
 import uuid
 
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, Index, Text, ForeignKey
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Index, Text, ForeignKey, Computed
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred, validates
 
 from app.database.connection import Base
 
+# Mirrors CoverLetter.calculate_completeness: five sections worth 20% each
+_COMPLETENESS_SQL = (
+    "20 * ("
+    "(CASE WHEN COALESCE(job_title, '') <> '' AND COALESCE(company_name, '') <> '' THEN 1 ELSE 0 END)"
+    " + (CASE WHEN COALESCE(content->>'opening_paragraph', '') ~ '\\S' THEN 1 ELSE 0 END)"
+    " + (CASE WHEN jsonb_path_exists(content, '$.body_paragraphs[*] ? (@ like_regex \"\\\\S\")')"
+    " THEN 1 ELSE 0 END)"
+    " + (CASE WHEN COALESCE(content->>'closing_paragraph', '') ~ '\\S' THEN 1 ELSE 0 END)"
+    " + (CASE WHEN COALESCE(hiring_manager_name, '') <> '' THEN 1 ELSE 0 END)"
+    ")"
+)
+
+
+def count_content_words(content: dict) -> int:
+    """Count words in the opening, body and closing paragraphs of cover letter content"""
+    try:
+        paragraphs = (
+            content.get('opening_paragraph', ''),
+            *content.get('body_paragraphs', []),
+            content.get('closing_paragraph', '')
+        )
+
+        # Split each paragraph on whitespace rather than joining them into one string
+        return sum(len(paragraph.split()) for paragraph in paragraphs if paragraph)
+    except Exception:
+        return 0
+
 
 class CoverLetter(Base):
     """Cover letter model for storing user cover letter data"""
@@ -34,6 +61,13 @@ class CoverLetter(Base):
     # Cover letter content as structured JSON
     content = Column(JSONB, nullable=False, default={})
 
+    # Derived from content at write time so list pages never need to load the JSON blob
+    completeness_percentage = Column(Integer, Computed(_COMPLETENESS_SQL, persisted=True))
+    word_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # Rendered HTML preview, cleared on update and rebuilt on next preview request
+    preview_html = deferred(Column(Text, nullable=True))
+
     # Version control
     version = Column(Integer, default=1, nullable=False)
 
@@ -64,6 +98,7 @@ class CoverLetter(Base):
         Index('idx_cover_letters_job_title', 'job_title'),
         Index('idx_cover_letters_created_at', 'created_at'),
         Index('idx_cover_letters_updated_at', 'updated_at'),
+        Index('idx_cover_letters_user_updated_id', 'user_id', 'updated_at', 'id'),
     )
 
     def __repr__(self):
@@ -88,6 +123,12 @@ class CoverLetter(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
 
+    @validates('content')
+    def _sync_word_count(self, key, content):
+        """Keep the stored word count in step with every content assignment"""
+        self.word_count = count_content_words(content or {})
+        return content
+
     @property
     def opening_paragraph(self):
         """Get opening paragraph from content"""
@@ -129,25 +170,7 @@ class CoverLetter(Base):
 
     def get_word_count(self) -> int:
         """Calculate word count of cover letter content"""
-        try:
-            word_count = 0
-
-            # Count opening paragraph
-            if self.opening_paragraph:
-                word_count += len(self.opening_paragraph.split())
-
-            # Count body paragraphs
-            for paragraph in self.body_paragraphs:
-                if paragraph:
-                    word_count += len(paragraph.split())
-
-            # Count closing paragraph
-            if self.closing_paragraph:
-                word_count += len(self.closing_paragraph.split())
-
-            return word_count
-        except Exception:
-            return 0
+        return count_content_words(self.content)
 
 
 class CoverLetterTemplate(Base):
@@ -1,14 +1,36 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func, or_
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session, load_only, undefer
+from sqlalchemy import and_, desc, func, or_, tuple_, literal
+from sqlalchemy.dialects.postgresql import JSONB
 from uuid import UUID
 import logging
 
 from app.repositories.base import BaseRepository
-from app.models.cover_letter import CoverLetter
+from app.models.cover_letter import CoverLetter, count_content_words
 
 logger = logging.getLogger(__name__)
 
+# Columns read when building list items; completeness and word count are stored, so content is not loaded
+_LIST_ITEM_COLUMNS = (
+    CoverLetter.id,
+    CoverLetter.title,
+    CoverLetter.job_title,
+    CoverLetter.company_name,
+    CoverLetter.template_id,
+    CoverLetter.completeness_percentage,
+    CoverLetter.word_count,
+    CoverLetter.version,
+    CoverLetter.is_active,
+    CoverLetter.is_template,
+    CoverLetter.created_at,
+    CoverLetter.updated_at,
+)
+
+
+# Fields that appear in (or title) the stored HTML preview
+_PREVIEW_FIELDS = frozenset({'content', 'title', 'job_title', 'company_name', 'hiring_manager_name'})
+
 
 class CoverLetterRepository(BaseRepository[CoverLetter]):
     """Repository for Cover Letter model with specific business logic"""
@@ -16,6 +38,34 @@ class CoverLetterRepository(BaseRepository[CoverLetter]):
     def __init__(self, db: Session):
         super().__init__(db, CoverLetter)
 
+    def _build_user_query(
+            self,
+            query,
+            user_id: UUID,
+            is_active: Optional[bool] = None,
+            company_name: Optional[str] = None
+    ):
+        """Apply the user/active/company filters shared by list and count queries"""
+        query = query.filter(CoverLetter.user_id == user_id)
+
+        if is_active is not None:
+            query = query.filter(CoverLetter.is_active == is_active)
+
+        if company_name:
+            query = query.filter(CoverLetter.company_name.ilike(f"%{company_name}%"))
+
+        return query
+
+    def _apply_ordering(self, query, order_by: str, order_desc: bool):
+        """Apply ordering by a model column if it exists, with id as a stable tie-breaker"""
+        if hasattr(CoverLetter, order_by):
+            order_column = getattr(CoverLetter, order_by)
+            if order_desc:
+                query = query.order_by(desc(order_column), desc(CoverLetter.id))
+            else:
+                query = query.order_by(order_column, CoverLetter.id)
+        return query
+
     def get_by_user(
             self,
             user_id: UUID,
@@ -28,35 +78,89 @@ class CoverLetterRepository(BaseRepository[CoverLetter]):
     ) -> List[CoverLetter]:
         """Get all cover letters for a specific user"""
         try:
-            filters = {"user_id": user_id}
-            if is_active is not None:
-                filters["is_active"] = is_active
-
             skip = (page - 1) * size
 
-            # Build query
-            query = self.db.query(CoverLetter).filter(
-                CoverLetter.user_id == user_id
+            query = self._build_user_query(
+                self.db.query(CoverLetter), user_id, is_active, company_name
             )
+            query = self._apply_ordering(query, order_by, order_desc)
 
-            if is_active is not None:
-                query = query.filter(CoverLetter.is_active == is_active)
+            return query.offset(skip).limit(size).all()
 
-            if company_name:
-                query = query.filter(CoverLetter.company_name.ilike(f"%{company_name}%"))
+        except Exception as e:
+            logger.error(f"Error getting cover letters for user {user_id}: {e}")
+            raise
 
-            # Apply ordering
-            if hasattr(CoverLetter, order_by):
-                order_column = getattr(CoverLetter, order_by)
-                if order_desc:
-                    query = query.order_by(desc(order_column))
-                else:
-                    query = query.order_by(order_column)
+    def get_page_with_total(
+            self,
+            user_id: UUID,
+            page: int = 1,
+            size: int = 10,
+            is_active: Optional[bool] = None,
+            company_name: Optional[str] = None,
+            order_by: str = "updated_at",
+            order_desc: bool = True
+    ) -> tuple[List[CoverLetter], int]:
+        """Get a page of user's cover letters (list item columns only) and the total count in a single query"""
+        try:
+            skip = (page - 1) * size
 
-            return query.offset(skip).limit(size).all()
+            # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row carries the full total
+            query = self._build_user_query(
+                self.db.query(CoverLetter, func.count().over().label('total')),
+                user_id, is_active, company_name
+            ).options(load_only(*_LIST_ITEM_COLUMNS))
+            query = self._apply_ordering(query, order_by, order_desc)
+
+            rows = query.offset(skip).limit(size).all()
+
+            if rows:
+                return [cover_letter for cover_letter, _ in rows], rows[0].total
+
+            # Page is past the end (or there are no rows), so the window total is unavailable
+            total = self.count_by_user(user_id, is_active, company_name) if skip else 0
+            return [], total
 
         except Exception as e:
-            logger.error(f"Error getting cover letters for user {user_id}: {e}")
+            logger.error(f"Error getting cover letter page for user {user_id}: {e}")
+            raise
+
+    def get_page_after_cursor(
+            self,
+            user_id: UUID,
+            cursor: Tuple[datetime, UUID],
+            size: int = 10,
+            is_active: Optional[bool] = None,
+            company_name: Optional[str] = None
+    ) -> tuple[List[CoverLetter], int]:
+        """Get the next page of user's cover letters (list item columns only) after a keyset cursor"""
+        try:
+            cursor_updated_at, cursor_id = cursor
+
+            # Total is read through a scalar subquery so the page still costs one round trip
+            total_query = self._build_user_query(
+                self.db.query(func.count(CoverLetter.id)), user_id, is_active, company_name
+            ).scalar_subquery()
+
+            query = self._build_user_query(
+                self.db.query(CoverLetter, total_query.label('total')),
+                user_id, is_active, company_name
+            ).options(load_only(*_LIST_ITEM_COLUMNS))
+
+            # Seek past the cursor on (updated_at, id) instead of scanning skipped rows with OFFSET
+            rows = query.filter(
+                tuple_(CoverLetter.updated_at, CoverLetter.id) < tuple_(cursor_updated_at, cursor_id)
+            ).order_by(
+                desc(CoverLetter.updated_at), desc(CoverLetter.id)
+            ).limit(size).all()
+
+            if rows:
+                return [cover_letter for cover_letter, _ in rows], rows[0].total
+
+            return [], self.count_by_user(user_id, is_active, company_name)
+
+        except Exception as e:
+            logger.error(f"Error getting cover letter page after cursor for user {user_id}: {e}")
             raise
 
     def count_by_user(
@@ -67,16 +171,10 @@ class CoverLetterRepository(BaseRepository[CoverLetter]):
     ) -> int:
         """Count cover letters for a specific user"""
         try:
-            query = self.db.query(CoverLetter).filter(
-                CoverLetter.user_id == user_id
+            query = self._build_user_query(
+                self.db.query(CoverLetter), user_id, is_active, company_name
             )
 
-            if is_active is not None:
-                query = query.filter(CoverLetter.is_active == is_active)
-
-            if company_name:
-                query = query.filter(CoverLetter.company_name.ilike(f"%{company_name}%"))
-
             return query.count()
 
         except Exception as e:
@@ -96,6 +194,40 @@ class CoverLetterRepository(BaseRepository[CoverLetter]):
             logger.error(f"Error getting cover letter {cover_letter_id} for user {user_id}: {e}")
             raise
 
+    def get_with_preview_by_id_and_user(self, cover_letter_id: UUID, user_id: UUID) -> Optional[CoverLetter]:
+        """Get cover letter by ID and verify ownership, loading the stored HTML preview"""
+        try:
+            return self.db.query(CoverLetter).options(
+                undefer(CoverLetter.preview_html)
+            ).filter(
+                and_(
+                    CoverLetter.id == cover_letter_id,
+                    CoverLetter.user_id == user_id
+                )
+            ).first()
+        except Exception as e:
+            logger.error(f"Error getting cover letter {cover_letter_id} with preview for user {user_id}: {e}")
+            raise
+
+    def save_preview_html(self, cover_letter: CoverLetter, preview_html: str) -> None:
+        """Store rendered HTML preview without touching updated_at"""
+        try:
+            self.db.query(CoverLetter).filter(
+                CoverLetter.id == cover_letter.id
+            ).update(
+                {
+                    CoverLetter.preview_html: preview_html,
+                    # Setting updated_at explicitly suppresses its onupdate timestamp
+                    CoverLetter.updated_at: CoverLetter.updated_at
+                },
+                synchronize_session=False
+            )
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error saving preview for cover letter {cover_letter.id}: {e}")
+            self.db.rollback()
+            raise
+
     def create_cover_letter(
             self,
             user_id: UUID,
@@ -147,11 +279,53 @@ class CoverLetterRepository(BaseRepository[CoverLetter]):
             # Remove None values
             clean_data = {k: v for k, v in update_data.items() if v is not None}
 
+            # Stored preview is stale only if a field it shows changed; it is rebuilt on next preview request.
+            # Clearing it unconditionally would dirty the row and bump updated_at on no-op updates.
+            if any(
+                    key in _PREVIEW_FIELDS and getattr(cover_letter, key) != value
+                    for key, value in clean_data.items()
+            ):
+                cover_letter.preview_html = None
+
             return self.update(cover_letter_id, clean_data)
         except Exception as e:
             logger.error(f"Error updating cover letter {cover_letter_id} for user {user_id}: {e}")
             raise
 
+    def patch_cover_letter_content(
+            self,
+            cover_letter: CoverLetter,
+            content_patch: Dict[str, Any],
+            update_data: Dict[str, Any]
+    ) -> CoverLetter:
+        """Merge changed content fields into the stored JSONB server-side and increment version"""
+        try:
+            values = {
+                getattr(CoverLetter, key): value
+                for key, value in update_data.items()
+                if value is not None and hasattr(CoverLetter, key)
+            }
+            # jsonb || jsonb replaces only the top-level keys present in the patch
+            values[CoverLetter.content] = CoverLetter.content.op('||', return_type=JSONB)(
+                literal(content_patch, JSONB)
+            )
+            # The server-side merge bypasses the content validator, so keep word_count in step here
+            values[CoverLetter.word_count] = count_content_words({**cover_letter.content, **content_patch})
+            values[CoverLetter.version] = CoverLetter.version + 1
+            values[CoverLetter.preview_html] = None
+
+            self.db.query(CoverLetter).filter(
+                CoverLetter.id == cover_letter.id
+            ).update(values, synchronize_session=False)
+            self.db.commit()
+            self.db.refresh(cover_letter)
+            logger.info(f"Patched content of CoverLetter with ID: {cover_letter.id}")
+            return cover_letter
+        except Exception as e:
+            logger.error(f"Error patching content of cover letter {cover_letter.id}: {e}")
+            self.db.rollback()
+            raise
+
     def delete_cover_letter(self, cover_letter_id: UUID, user_id: UUID) -> bool:
         """Delete cover letter after verifying ownership"""
         try:
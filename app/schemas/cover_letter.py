@@ -37,6 +37,21 @@ class CoverLetterCreate(BaseModel):
     resume_id: Optional[UUID] = Field(None, description="Associated resume ID")
 
 
+class CoverLetterContentPatch(BaseModel):
+    """Schema for partially updating cover letter content"""
+    opening_paragraph: Optional[str] = Field(None, min_length=10, max_length=1000, description="Opening paragraph")
+    body_paragraphs: Optional[List[str]] = Field(None, min_items=1, max_items=5, description="Body paragraphs")
+    closing_paragraph: Optional[str] = Field(None, min_length=10, max_length=500, description="Closing paragraph")
+    signature: Optional[str] = Field(None, max_length=100, description="Signature line")
+    postscript: Optional[str] = Field(None, max_length=200, description="P.S. section")
+
+    @validator('body_paragraphs')
+    def validate_body_paragraphs(cls, v):
+        if v is None:
+            return v
+        return CoverLetterContent.validate_body_paragraphs(v)
+
+
 class CoverLetterUpdate(BaseModel):
     """Schema for updating an existing cover letter"""
     title: Optional[str] = Field(None, min_length=1, max_length=255, description="Cover letter title")
@@ -44,6 +59,9 @@ class CoverLetterUpdate(BaseModel):
     company_name: Optional[str] = Field(None, max_length=255, description="Company name")
     hiring_manager_name: Optional[str] = Field(None, max_length=255, description="Hiring manager name")
     content: Optional[CoverLetterContent] = Field(None, description="Cover letter content")
+    content_patch: Optional[CoverLetterContentPatch] = Field(
+        None, description="Partial content update, ignored when full content is provided"
+    )
     template_id: Optional[str] = Field(None, max_length=50, description="Template ID")
     resume_id: Optional[UUID] = Field(None, description="Associated resume ID")
 
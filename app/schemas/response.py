@@ -9,11 +9,12 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response schema"""
     items: List[T]
     total: int = Field(..., ge=0, description="Total number of items")
-    page: int = Field(..., ge=1, description="Current page number")
+    page: Optional[int] = Field(..., ge=1, description="Current page number; null when paging by cursor")
     size: int = Field(..., ge=1, description="Items per page")
     pages: int = Field(..., ge=1, description="Total number of pages")
     has_next: bool = Field(False, description="Whether there's a next page")
-    has_prev: bool = Field(False, description="Whether there's a previous page")
+    has_prev: Optional[bool] = Field(False, description="Whether there's a previous page; null when paging by cursor")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page")
 
     @classmethod
     def create(
@@ -21,7 +22,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
             items: List[T],
             total: int,
             page: int,
-            size: int
+            size: int,
+            next_cursor: Optional[str] = None
     ) -> "PaginatedResponse[T]":
         """Create paginated response"""
         pages = (total + size - 1) // size if total > 0 else 1
@@ -35,7 +37,30 @@ class PaginatedResponse(BaseModel, Generic[T]):
             size=size,
             pages=pages,
             has_next=has_next,
-            has_prev=has_prev
+            has_prev=has_prev,
+            next_cursor=next_cursor
+        )
+
+    @classmethod
+    def create_for_cursor(
+            cls,
+            items: List[T],
+            total: int,
+            size: int,
+            next_cursor: Optional[str]
+    ) -> "PaginatedResponse[T]":
+        """Create paginated response for a page fetched by cursor, which has no page number"""
+        pages = (total + size - 1) // size if total > 0 else 1
+
+        return cls(
+            items=items,
+            total=total,
+            page=None,
+            size=size,
+            pages=pages,
+            has_next=next_cursor is not None,
+            has_prev=None,
+            next_cursor=next_cursor
         )
 
 
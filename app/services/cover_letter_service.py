@@ -1,31 +1,92 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from sqlalchemy.orm import Session
+import base64
 import logging
 import re
+from html import escape
 
 from app.repositories.cover_letter_repository import CoverLetterRepository
 from app.services.cover_letter_validation_service import CoverLetterValidationService
-from app.services.export_service import ExportService
+from app.services.export_service import ExportService, get_export_service
 from app.services.resume_service import ResumeService
 from app.schemas.cover_letter import (
     CoverLetterCreate, CoverLetterUpdate, CoverLetterResponse, CoverLetterListItem,
     CoverLetterValidation, CoverLetterPreview, CoverLetterFromResume, CoverLetterAIRequest
 )
 from app.schemas.response import PaginatedResponse
+from app.schemas.resume import ResumeResponse
 
 logger = logging.getLogger(__name__)
 
+# HTML preview templates, filled once per preview instead of appending fragments.
+# Styling lives in one <style> block with short prefixed classes rather than inline on every element.
+_PREVIEW_STYLES = (
+    '<style>'
+    '.cover-letter-preview{font-family:Arial,sans-serif;max-width:800px;margin:0 auto;padding:20px;line-height:1.6}'
+    '.cl-header{margin-bottom:30px;text-align:center}'
+    '.cl-header h2{color:#2E4057;margin-bottom:5px}'
+    '.cl-header h3{color:#666;margin-top:0}'
+    '.cl-recipient{margin-bottom:30px}'
+    '.cl-date{margin-bottom:10px}'
+    '.cl-line{margin-bottom:5px}'
+    '.cl-para{margin-bottom:20px;text-align:justify}'
+    '.cl-signature{margin-top:30px}'
+    '.cl-name{margin-bottom:0;font-weight:bold}'
+    '.cl-ps{margin-top:20px}'
+    '</style>'
+)
+_PREVIEW_TEMPLATE = (
+    # CSS braces are doubled so str.format leaves them intact
+    '<div class="cover-letter-preview">' + _PREVIEW_STYLES.replace('{', '{{').replace('}', '}}') +
+    '{header}{date_recipient}{opening}{body}{closing}{signature_block}{postscript_block}'
+    '</div>'
+)
+_PREVIEW_HEADER_TEMPLATE = '<div class="cl-header">{job_title}{company_name}</div>'
+_PREVIEW_JOB_TITLE_TEMPLATE = '<h2>Application for {}</h2>'
+_PREVIEW_COMPANY_NAME_TEMPLATE = '<h3>at {}</h3>'
+_PREVIEW_DATE_RECIPIENT_TEMPLATE = (
+    '<div class="cl-recipient">'
+    '<p class="cl-date"><strong>Date:</strong> {date}</p>'
+    '<p class="cl-line"><strong>Dear {salutation},</strong></p>'
+    '</div>'
+)
+_PREVIEW_PARAGRAPH_TEMPLATE = '<p class="cl-para">{}</p>'
+_PREVIEW_SIGNATURE_TEMPLATE = (
+    '<div class="cl-signature">'
+    '<p class="cl-line">Sincerely,</p>'
+    '<p class="cl-name">{}</p>'
+    '</div>'
+)
+_PREVIEW_POSTSCRIPT_TEMPLATE = '<div class="cl-ps"><p><strong>P.S.</strong> {}</p></div>'
+
 
 class CoverLetterService:
     """Service layer for cover letter operations"""
 
     def __init__(self, db: Session):
         self.repository = CoverLetterRepository(db)
-        self.validation_service = CoverLetterValidationService()
-        self.export_service = ExportService()
+        # Stateless services are shared; only Session-bound ones are built per request
+        self.validation_service = _VALIDATION_SERVICE
         self.resume_service = ResumeService(db)
         self.db = db
+        # Resumes fetched during this request, keyed by (resume_id, user_id)
+        self._resume_cache: Dict[Tuple[UUID, UUID], Optional[ResumeResponse]] = {}
+
+    @property
+    def export_service(self) -> ExportService:
+        """Shared export service, created on first use"""
+        return get_export_service()
+
+    async def _get_resume_cached(self, resume_id: UUID, user_id: UUID) -> Optional[ResumeResponse]:
+        """Get resume once per service instance, reusing it across generate/create calls"""
+        cache_key = (resume_id, user_id)
+        if cache_key not in self._resume_cache:
+            self._resume_cache[cache_key] = await self.resume_service.get_resume(resume_id, user_id)
+        return self._resume_cache[cache_key]
 
     async def create_cover_letter(self, user_id: UUID, cover_letter_data: CoverLetterCreate) -> CoverLetterResponse:
         """Create a new cover letter for user"""
@@ -34,14 +95,15 @@ class CoverLetterService:
 
             # Validate resume association if provided
             if cover_letter_data.resume_id:
-                resume = await self.resume_service.get_resume(cover_letter_data.resume_id, user_id)
+                resume = await self._get_resume_cached(cover_letter_data.resume_id, user_id)
                 if not resume:
                     raise ValueError(f"Resume {cover_letter_data.resume_id} not found")
 
+            # Serialize content once for both validation and storage
+            content_dict = cover_letter_data.content.dict()
+
             # Validate content
-            validation_result = self.validation_service.validate_cover_letter_content(
-                cover_letter_data.content.dict()
-            )
+            validation_result = self.validation_service.validate_cover_letter_content(content_dict)
 
             if not validation_result.is_valid:
                 error_msg = f"Invalid cover letter content: {', '.join(validation_result.validation_errors)}"
@@ -55,7 +117,7 @@ class CoverLetterService:
                 job_title=cover_letter_data.job_title,
                 company_name=cover_letter_data.company_name,
                 hiring_manager_name=cover_letter_data.hiring_manager_name,
-                content=cover_letter_data.content.dict(),
+                content=content_dict,
                 template_id=cover_letter_data.template_id or "professional",
                 resume_id=cover_letter_data.resume_id
             )
@@ -75,14 +137,23 @@ class CoverLetterService:
             page: int = 1,
             size: int = 10,
             is_active: Optional[bool] = None,
-            company_name: Optional[str] = None
+            company_name: Optional[str] = None,
+            cursor: Optional[str] = None
     ) -> PaginatedResponse[CoverLetterListItem]:
-        """Get paginated list of user's cover letters"""
-        try:
-            logger.info(f"Getting cover letters for user {user_id}, page {page}, size {size}")
+        """Get paginated list of user's cover letters, by page number or by cursor"""
+        logger.info(f"Getting cover letters for user {user_id}, page {page}, size {size}")
 
-            # Get cover letters
-            cover_letters = self.repository.get_by_user(
+        # Get cover letters and total count in one round trip
+        if cursor:
+            cover_letters, total = self.repository.get_page_after_cursor(
+                user_id=user_id,
+                cursor=self._decode_cursor(cursor),
+                size=size,
+                is_active=is_active,
+                company_name=company_name
+            )
+        else:
+            cover_letters, total = self.repository.get_page_with_total(
                 user_id=user_id,
                 page=page,
                 size=size,
@@ -90,60 +161,57 @@ class CoverLetterService:
                 company_name=company_name
             )
 
-            # Get total count
-            total = self.repository.count_by_user(user_id, is_active, company_name)
+        # Convert to list items; completeness and word count are read from their stored columns
+        cover_letter_items = []
+        for cover_letter in cover_letters:
+            try:
+                cover_letter_item = CoverLetterListItem(
+                    id=cover_letter.id,
+                    title=cover_letter.title,
+                    job_title=cover_letter.job_title,
+                    company_name=cover_letter.company_name,
+                    template_id=cover_letter.template_id,
+                    version=cover_letter.version,
+                    is_active=cover_letter.is_active,
+                    is_template=cover_letter.is_template,
+                    created_at=cover_letter.created_at,
+                    updated_at=cover_letter.updated_at,
+                    completeness_percentage=cover_letter.completeness_percentage,
+                    word_count=cover_letter.word_count
+                )
+                cover_letter_items.append(cover_letter_item)
+            except Exception as e:
+                logger.error(f"Error processing cover letter {cover_letter.id}: {e}")
 
-            # Convert to list items with completeness and word count
-            cover_letter_items = []
-            for cover_letter in cover_letters:
-                try:
-                    completeness = cover_letter.calculate_completeness()
-                    word_count = cover_letter.get_word_count()
-
-                    cover_letter_item = CoverLetterListItem(
-                        id=cover_letter.id,
-                        title=cover_letter.title,
-                        job_title=cover_letter.job_title,
-                        company_name=cover_letter.company_name,
-                        template_id=cover_letter.template_id,
-                        version=cover_letter.version,
-                        is_active=cover_letter.is_active,
-                        is_template=cover_letter.is_template,
-                        created_at=cover_letter.created_at,
-                        updated_at=cover_letter.updated_at,
-                        completeness_percentage=completeness['percentage'],
-                        word_count=word_count
-                    )
-                    cover_letter_items.append(cover_letter_item)
-                except Exception as e:
-                    logger.error(f"Error processing cover letter {cover_letter.id}: {e}")
+        # A full page means there may be more rows after the last item
+        next_cursor = self._encode_cursor(cover_letters[-1]) if len(cover_letters) == size else None
 
-            return PaginatedResponse.create(
+        if cursor:
+            return PaginatedResponse.create_for_cursor(
                 items=cover_letter_items,
                 total=total,
-                page=page,
-                size=size
+                size=size,
+                next_cursor=next_cursor
             )
 
-        except Exception as e:
-            logger.error(f"Error getting cover letters for user {user_id}: {e}")
-            raise
+        return PaginatedResponse.create(
+            items=cover_letter_items,
+            total=total,
+            page=page,
+            size=size,
+            next_cursor=next_cursor
+        )
 
     async def get_cover_letter(self, cover_letter_id: UUID, user_id: UUID) -> Optional[CoverLetterResponse]:
         """Get specific cover letter by ID"""
-        try:
-            logger.info(f"Getting cover letter {cover_letter_id} for user {user_id}")
+        logger.info(f"Getting cover letter {cover_letter_id} for user {user_id}")
 
-            cover_letter = self.repository.get_by_id_and_user(cover_letter_id, user_id)
-            if not cover_letter:
-                logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
-                return None
+        cover_letter = self.repository.get_by_id_and_user(cover_letter_id, user_id)
+        if not cover_letter:
+            logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
+            return None
 
-            return self._convert_to_response(cover_letter)
-
-        except Exception as e:
-            logger.error(f"Error getting cover letter {cover_letter_id} for user {user_id}: {e}")
-            raise
+        return self._convert_to_response(cover_letter)
 
     async def update_cover_letter(
             self,
@@ -157,37 +225,51 @@ class CoverLetterService:
 
             # Validate resume association if provided
             if update_data.resume_id:
-                resume = await self.resume_service.get_resume(update_data.resume_id, user_id)
+                resume = await self._get_resume_cached(update_data.resume_id, user_id)
                 if not resume:
                     raise ValueError(f"Resume {update_data.resume_id} not found")
 
-            # Validate content if provided
-            if update_data.content:
-                validation_result = self.validation_service.validate_cover_letter_content(
-                    update_data.content.dict()
-                )
+            # Serialize content once for both validation and storage
+            content_dict = update_data.content.dict() if update_data.content is not None else None
+
+            # A partial content patch only applies when full content is not provided
+            content_patch = None
+            if content_dict is None and update_data.content_patch is not None:
+                content_patch = update_data.content_patch.dict(exclude_none=True) or None
 
-                if not validation_result.is_valid:
-                    error_msg = f"Invalid cover letter content: {', '.join(validation_result.validation_errors)}"
-                    logger.warning(f"Cover letter validation failed: {error_msg}")
-                    raise ValueError(error_msg)
+            # Prepare update data from the fields the client actually sent
+            update_dict = {
+                field: getattr(update_data, field)
+                for field in update_data.__fields_set__
+                if field not in ('content', 'content_patch')
+            }
 
-            # Prepare update data
-            update_dict = {}
-            for field in ['title', 'job_title', 'company_name', 'hiring_manager_name', 'template_id', 'resume_id']:
-                value = getattr(update_data, field, None)
-                if value is not None:
-                    update_dict[field] = value
+            if content_patch:
+                existing = self.repository.get_by_id_and_user(cover_letter_id, user_id)
+                if not existing:
+                    logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
+                    return None
 
-            if update_data.content is not None:
-                update_dict['content'] = update_data.content.dict()
+                # Validate the merged result, then send only the changed fields to the database
+                self._validate_content_or_raise({**existing.content, **content_patch})
 
-            # Update cover letter
-            cover_letter = self.repository.update_cover_letter(
-                cover_letter_id=cover_letter_id,
-                user_id=user_id,
-                update_data=update_dict
-            )
+                cover_letter = self.repository.patch_cover_letter_content(
+                    cover_letter=existing,
+                    content_patch=content_patch,
+                    update_data=update_dict
+                )
+            else:
+                # Validate content if provided
+                if content_dict:
+                    self._validate_content_or_raise(content_dict)
+                    update_dict['content'] = content_dict
+
+                # Update cover letter
+                cover_letter = self.repository.update_cover_letter(
+                    cover_letter_id=cover_letter_id,
+                    user_id=user_id,
+                    update_data=update_dict
+                )
 
             if not cover_letter:
                 logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
@@ -202,23 +284,27 @@ class CoverLetterService:
             logger.error(f"Error updating cover letter {cover_letter_id} for user {user_id}: {e}")
             raise
 
+    def _validate_content_or_raise(self, content_dict: Dict[str, Any]) -> None:
+        """Validate cover letter content, raising ValueError with all validation errors"""
+        validation_result = self.validation_service.validate_cover_letter_content(content_dict)
+
+        if not validation_result.is_valid:
+            error_msg = f"Invalid cover letter content: {', '.join(validation_result.validation_errors)}"
+            logger.warning(f"Cover letter validation failed: {error_msg}")
+            raise ValueError(error_msg)
+
     async def delete_cover_letter(self, cover_letter_id: UUID, user_id: UUID) -> bool:
         """Delete cover letter"""
-        try:
-            logger.info(f"Deleting cover letter {cover_letter_id} for user {user_id}")
+        logger.info(f"Deleting cover letter {cover_letter_id} for user {user_id}")
 
-            success = self.repository.delete_cover_letter(cover_letter_id, user_id)
+        success = self.repository.delete_cover_letter(cover_letter_id, user_id)
 
-            if success:
-                logger.info(f"Successfully deleted cover letter {cover_letter_id} for user {user_id}")
-            else:
-                logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
-
-            return success
+        if success:
+            logger.info(f"Successfully deleted cover letter {cover_letter_id} for user {user_id}")
+        else:
+            logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
 
-        except Exception as e:
-            logger.error(f"Error deleting cover letter {cover_letter_id} for user {user_id}: {e}")
-            raise
+        return success
 
     async def generate_from_resume(
             self,
@@ -230,25 +316,13 @@ class CoverLetterService:
             logger.info(f"Generating cover letter from resume {request_data.resume_id} for user {user_id}")
 
             # Get resume
-            resume = await self.resume_service.get_resume(request_data.resume_id, user_id)
+            resume = await self._get_resume_cached(request_data.resume_id, user_id)
             if not resume:
                 raise ValueError(f"Resume {request_data.resume_id} not found")
 
-            # Extract relevant information from resume
-            personal_info = resume.content.personal_info
-            work_experience = resume.content.work_experience
-            skills = resume.content.skills
-            professional_summary = resume.content.professional_summary
-
             # Generate AI-powered content
-            ai_service = CoverLetterAIService()
-            generated_content = await ai_service.generate_from_resume(
-                resume_data={
-                    "personal_info": personal_info.dict(),
-                    "work_experience": [exp.dict() for exp in work_experience],
-                    "skills": skills.dict(),
-                    "professional_summary": professional_summary
-                },
+            generated_content = await _get_ai_service().generate_from_resume(
+                resume_data=self._extract_resume_data(resume),
                 job_title=request_data.job_title,
                 company_name=request_data.company_name,
                 job_description=request_data.job_description,
@@ -288,18 +362,12 @@ class CoverLetterService:
             # Get resume data if provided
             resume_data = None
             if request_data.resume_id:
-                resume = await self.resume_service.get_resume(request_data.resume_id, user_id)
+                resume = await self._get_resume_cached(request_data.resume_id, user_id)
                 if resume:
-                    resume_data = {
-                        "personal_info": resume.content.personal_info.dict(),
-                        "work_experience": [exp.dict() for exp in resume.content.work_experience],
-                        "skills": resume.content.skills.dict(),
-                        "professional_summary": resume.content.professional_summary
-                    }
+                    resume_data = self._extract_resume_data(resume)
 
             # Generate AI content
-            ai_service = CoverLetterAIService()
-            generated_content = await ai_service.generate_ai_content(
+            generated_content = await _get_ai_service().generate_ai_content(
                 job_title=request_data.job_title,
                 company_name=request_data.company_name,
                 job_description=request_data.job_description,
@@ -329,43 +397,46 @@ class CoverLetterService:
 
     async def validate_cover_letter(self, cover_letter_id: UUID, user_id: UUID) -> Optional[CoverLetterValidation]:
         """Validate cover letter content and return recommendations"""
-        try:
-            logger.info(f"Validating cover letter {cover_letter_id} for user {user_id}")
-
-            cover_letter = self.repository.get_by_id_and_user(cover_letter_id, user_id)
-            if not cover_letter:
-                logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
-                return None
+        logger.info(f"Validating cover letter {cover_letter_id} for user {user_id}")
 
-            validation_result = self.validation_service.validate_cover_letter_content(cover_letter.content)
-            validation_result.word_count = cover_letter.get_word_count()
+        cover_letter = self.repository.get_by_id_and_user(cover_letter_id, user_id)
+        if not cover_letter:
+            logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
+            return None
 
-            logger.info(
-                f"Cover letter {cover_letter_id} validation completed: {validation_result.completeness_percentage}% complete")
-            return validation_result
+        # Results are cached by content hash; word_count is computed from the same content
+        validation_result = self.validation_service.validate_cover_letter_content(cover_letter.content)
 
-        except Exception as e:
-            logger.error(f"Error validating cover letter {cover_letter_id} for user {user_id}: {e}")
-            raise
+        logger.info(
+            f"Cover letter {cover_letter_id} validation completed: {validation_result.completeness_percentage}% complete")
+        return validation_result
 
     async def get_cover_letter_preview(self, cover_letter_id: UUID, user_id: UUID) -> Optional[CoverLetterPreview]:
         """Get cover letter preview with HTML and completeness info"""
         try:
             logger.info(f"Getting preview for cover letter {cover_letter_id} for user {user_id}")
 
-            cover_letter = self.repository.get_by_id_and_user(cover_letter_id, user_id)
+            cover_letter = self.repository.get_with_preview_by_id_and_user(cover_letter_id, user_id)
             if not cover_letter:
                 logger.warning(f"Cover letter {cover_letter_id} not found for user {user_id}")
                 return None
 
-            # Generate HTML preview
-            preview_html = self._generate_html_preview(cover_letter)
+            # Serve stored HTML preview, rendering it on first request after a write
+            preview_html = cover_letter.preview_html
+            render_succeeded = False
+            if preview_html is None:
+                try:
+                    preview_html = self._generate_html_preview(cover_letter)
+                    render_succeeded = True
+                except Exception as e:
+                    logger.error(f"Error generating HTML preview: {e}")
+                    preview_html = f'<div class="cover-letter-preview" style="padding: 20px; color: #666;"><p>Preview generation failed: {escape(str(e))}</p></div>'
 
             # Get completeness info
             completeness = cover_letter.calculate_completeness()
             word_count = cover_letter.get_word_count()
 
-            return CoverLetterPreview(
+            preview = CoverLetterPreview(
                 id=cover_letter.id,
                 title=cover_letter.title,
                 preview_html=preview_html,
@@ -373,10 +444,39 @@ class CoverLetterService:
                 word_count=word_count
             )
 
+            # Storing the preview is only a cache fill, so a failed write must not fail the read
+            if render_succeeded:
+                try:
+                    self.repository.save_preview_html(cover_letter, preview_html)
+                except Exception as e:
+                    logger.warning(f"Could not store preview for cover letter {cover_letter_id}: {e}")
+
+            return preview
+
         except Exception as e:
             logger.error(f"Error getting preview for cover letter {cover_letter_id}: {e}")
             raise
 
+    def _extract_resume_data(self, resume: ResumeResponse) -> Dict[str, Any]:
+        """Extract the resume sections used for cover letter generation in one traversal"""
+        return resume.content.dict(
+            include={'personal_info', 'work_experience', 'skills', 'professional_summary'}
+        )
+
+    def _encode_cursor(self, cover_letter) -> str:
+        """Encode the (updated_at, id) keyset position of a cover letter as an opaque cursor"""
+        raw_cursor = f"{cover_letter.updated_at.isoformat()}|{cover_letter.id}"
+        return base64.urlsafe_b64encode(raw_cursor.encode('utf-8')).decode('ascii')
+
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, UUID]:
+        """Decode an opaque cursor back into its (updated_at, id) keyset position"""
+        try:
+            raw_cursor = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+            updated_at, cover_letter_id = raw_cursor.split('|')
+            return datetime.fromisoformat(updated_at), UUID(cover_letter_id)
+        except ValueError:
+            raise ValueError("Invalid pagination cursor")
+
     def _convert_to_response(self, cover_letter) -> CoverLetterResponse:
         """Convert cover letter model to response schema"""
         try:
@@ -385,8 +485,8 @@ class CoverLetterService:
             # Parse content into structured format
             content_dict = cover_letter.content
 
-            # Create CoverLetterContent object with proper validation
-            cover_letter_content = CoverLetterContent(
+            # Content was validated before it was stored, so skip re-validation
+            cover_letter_content = CoverLetterContent.construct(
                 opening_paragraph=content_dict.get('opening_paragraph', ''),
                 body_paragraphs=content_dict.get('body_paragraphs', []),
                 closing_paragraph=content_dict.get('closing_paragraph', ''),
@@ -416,75 +516,74 @@ class CoverLetterService:
 
     def _generate_html_preview(self, cover_letter) -> str:
         """Generate HTML preview of cover letter content"""
-        try:
-            html_parts = [
-                '<div class="cover-letter-preview" style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; line-height: 1.6;">']
-
-            # Header with job information
-            if cover_letter.job_title or cover_letter.company_name:
-                html_parts.append('<div class="header" style="margin-bottom: 30px; text-align: center;">')
-                if cover_letter.job_title:
-                    html_parts.append(
-                        f'<h2 style="color: #2E4057; margin-bottom: 5px;">Application for {cover_letter.job_title}</h2>')
-                if cover_letter.company_name:
-                    html_parts.append(f'<h3 style="color: #666; margin-top: 0;">at {cover_letter.company_name}</h3>')
-                html_parts.append('</div>')
-
-            # Date and recipient
-            html_parts.append('<div class="date-recipient" style="margin-bottom: 30px;">')
-            html_parts.append(
-                f'<p style="margin-bottom: 10px;"><strong>Date:</strong> {cover_letter.created_at.strftime("%B %d, %Y")}</p>')
-
-            if cover_letter.hiring_manager_name:
-                html_parts.append(
-                    f'<p style="margin-bottom: 5px;"><strong>Dear {cover_letter.hiring_manager_name},</strong></p>')
-            elif cover_letter.company_name:
-                html_parts.append(
-                    f'<p style="margin-bottom: 5px;"><strong>Dear {cover_letter.company_name} Hiring Team,</strong></p>')
-            else:
-                html_parts.append('<p style="margin-bottom: 5px;"><strong>Dear Hiring Manager,</strong></p>')
-            html_parts.append('</div>')
-
-            # Opening paragraph
-            opening = cover_letter.content.get('opening_paragraph', '')
-            if opening:
-                html_parts.append(f'<p style="margin-bottom: 20px; text-align: justify;">{opening}</p>')
-
-            # Body paragraphs
-            body_paragraphs = cover_letter.content.get('body_paragraphs', [])
-            for paragraph in body_paragraphs:
-                if paragraph.strip():
-                    html_parts.append(f'<p style="margin-bottom: 20px; text-align: justify;">{paragraph}</p>')
-
-            # Closing paragraph
-            closing = cover_letter.content.get('closing_paragraph', '')
-            if closing:
-                html_parts.append(f'<p style="margin-bottom: 20px; text-align: justify;">{closing}</p>')
-
-            # Signature
-            html_parts.append('<div class="signature" style="margin-top: 30px;">')
-            html_parts.append('<p style="margin-bottom: 5px;">Sincerely,</p>')
-
-            signature = cover_letter.content.get('signature')
-            if signature:
-                html_parts.append(f'<p style="margin-bottom: 0; font-weight: bold;">{signature}</p>')
-            else:
-                html_parts.append('<p style="margin-bottom: 0; font-weight: bold;">[Your Name]</p>')
-            html_parts.append('</div>')
+        content = cover_letter.content
+        job_title = escape(cover_letter.job_title) if cover_letter.job_title else ''
+        company_name = escape(cover_letter.company_name) if cover_letter.company_name else ''
+
+        # Header with job information
+        header = (
+            _PREVIEW_HEADER_TEMPLATE.format(
+                job_title=_PREVIEW_JOB_TITLE_TEMPLATE.format(job_title) if job_title else '',
+                company_name=_PREVIEW_COMPANY_NAME_TEMPLATE.format(company_name) if company_name else ''
+            ) if job_title or company_name else ''
+        )
 
-            # Postscript
-            postscript = cover_letter.content.get('postscript')
-            if postscript:
-                html_parts.append(
-                    f'<div class="postscript" style="margin-top: 20px;"><p><strong>P.S.</strong> {postscript}</p></div>')
+        # Date and recipient
+        if cover_letter.hiring_manager_name:
+            salutation = escape(cover_letter.hiring_manager_name)
+        elif company_name:
+            salutation = f"{company_name} Hiring Team"
+        else:
+            salutation = "Hiring Manager"
+
+        opening = content.get('opening_paragraph', '')
+        closing = content.get('closing_paragraph', '')
+        signature = content.get('signature')
+        postscript = content.get('postscript')
+
+        return _PREVIEW_TEMPLATE.format_map({
+            'header': header,
+            'date_recipient': _PREVIEW_DATE_RECIPIENT_TEMPLATE.format(
+                date=cover_letter.created_at.strftime("%B %d, %Y"),
+                salutation=salutation
+            ),
+            'opening': _PREVIEW_PARAGRAPH_TEMPLATE.format(escape(opening)) if opening else '',
+            'body': ''.join(
+                _PREVIEW_PARAGRAPH_TEMPLATE.format(escape(paragraph))
+                for paragraph in content.get('body_paragraphs', [])
+                if paragraph.strip()
+            ),
+            'closing': _PREVIEW_PARAGRAPH_TEMPLATE.format(escape(closing)) if closing else '',
+            'signature_block': _PREVIEW_SIGNATURE_TEMPLATE.format(
+                escape(signature) if signature else '[Your Name]'
+            ),
+            'postscript_block': _PREVIEW_POSTSCRIPT_TEMPLATE.format(escape(postscript)) if postscript else ''
+        })
+
+
+# Job title keyword tables, checked in order so earlier categories win.
+# Each row is one precompiled alternation rather than a chain of substring scans.
+_FIELD_PATTERNS = (
+    (re.compile('engineer|developer|programmer|software'), "software development"),
+    (re.compile('manager|director|lead'), "leadership and management"),
+    (re.compile('analyst|data|research'), "data analysis"),
+    (re.compile('marketing|sales|business'), "business development"),
+    (re.compile('design|creative|ui|ux'), "design and user experience"),
+)
 
-            html_parts.append('</div>')
+_INDUSTRY_PATTERNS = (
+    (re.compile('software|tech|engineer|developer'), "technology"),
+    (re.compile('healthcare|medical|nurse|doctor'), "healthcare"),
+    (re.compile('finance|accounting|bank'), "finance"),
+    (re.compile('education|teacher|professor'), "education"),
+    (re.compile('marketing|advertising|brand'), "marketing"),
+)
 
-            return ''.join(html_parts)
 
-        except Exception as e:
-            logger.error(f"Error generating HTML preview: {e}")
-            return f'<div class="cover-letter-preview" style="padding: 20px; color: #666;"><p>Preview generation failed: {str(e)}</p></div>'
+# Fallback phrases for resume-based paragraphs when the resume lists no skills.
+# Skill lists there are always lists, so an empty join falls through with `or`.
+_DEFAULT_RESUME_SKILLS_TEXT = 'my diverse skill set'
+_DEFAULT_CORE_COMPETENCIES_TEXT = 'problem-solving and analytical thinking'
 
 
 # AI Service for Cover Letter Generation
@@ -494,8 +593,10 @@ class CoverLetterAIService:
     def __init__(self):
         self.templates = self._load_ai_templates()
 
-    def _load_ai_templates(self) -> Dict[str, Dict[str, Any]]:
-        """Load AI generation templates"""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_ai_templates() -> Dict[str, Dict[str, Any]]:
+        """Load AI generation templates (built once and shared, never mutated)"""
         return {
             "professional": {
                 "opening_templates": [
@@ -548,15 +649,18 @@ class CoverLetterAIService:
             # Get most recent job
             recent_job = work_experience[0] if work_experience else {}
 
-            # Extract relevant skills
-            all_skills = []
-            for skill_category in skills.values():
-                if isinstance(skill_category, list):
-                    all_skills.extend(skill_category)
+            # Extract relevant skills; only the first five are used, so stop once they are found
+            top_skills = list(islice(chain.from_iterable(
+                skill_category for skill_category in skills.values() if isinstance(skill_category, list)
+            ), 5))
+
+            # The three sections are independent, but each is microseconds of string formatting.
+            # They run inline: asyncio.to_thread/gather would cost more in scheduling than it saves.
+            # Gather them once a section awaits real I/O (e.g. a model call).
 
             # Generate opening paragraph
             opening = self._generate_opening_from_resume(
-                job_title, company_name, recent_job, all_skills[:5]
+                job_title, company_name, recent_job, top_skills
             )
 
             # Generate body paragraphs
@@ -566,7 +670,7 @@ class CoverLetterAIService:
 
             # Generate closing paragraph
             closing = self._generate_closing_from_resume(
-                job_title, company_name, all_skills[:3]
+                job_title, company_name, top_skills[:3]
             )
 
             return {
@@ -603,15 +707,15 @@ class CoverLetterAIService:
 
             # Generate from scratch using templates
             opening = self._generate_ai_opening(
-                job_title, company_name, templates, user_background, key_skills
+                job_title, company_name, templates, key_skills
             )
 
             body_paragraphs = self._generate_ai_body(
-                job_title, company_name, job_description, user_background, key_skills, templates
+                job_title, company_name, job_description, user_background, key_skills
             )
 
             closing = self._generate_ai_closing(
-                job_title, company_name, templates, key_skills
+                job_title, company_name, key_skills
             )
 
             return {
@@ -628,7 +732,7 @@ class CoverLetterAIService:
                                       skills: List[str]) -> str:
         """Generate opening paragraph from resume data"""
         previous_role = recent_job.get('job_title', 'my previous role')
-        relevant_skills = ', '.join(skills[:3]) if skills else 'my diverse skill set'
+        relevant_skills = ', '.join(skills[:3]) or _DEFAULT_RESUME_SKILLS_TEXT
 
         return f"I am writing to express my strong interest in the {job_title} position at {company_name}. With my experience as {previous_role} and expertise in {relevant_skills}, I am confident I would be a valuable addition to your team."
 
@@ -653,12 +757,12 @@ class CoverLetterAIService:
             )
 
         # Second body paragraph - skills and company fit
-        all_skills = []
-        for skill_category in skills.values():
-            if isinstance(skill_category, list):
-                all_skills.extend(skill_category[:2])
+        # Up to two skills per category, stopping as soon as four are collected
+        top_skills = list(islice(chain.from_iterable(
+            skill_category[:2] for skill_category in skills.values() if isinstance(skill_category, list)
+        ), 4))
 
-        key_skills_text = ', '.join(all_skills[:4]) if all_skills else 'problem-solving and analytical thinking'
+        key_skills_text = ', '.join(top_skills) or _DEFAULT_CORE_COMPETENCIES_TEXT
 
         paragraphs.append(
             f"My core competencies include {key_skills_text}, which align well with the requirements for this role. "
@@ -670,92 +774,107 @@ class CoverLetterAIService:
 
     def _generate_closing_from_resume(self, job_title: str, company_name: str, key_skills: List[str]) -> str:
         """Generate closing paragraph from resume data"""
-        skills_text = ', '.join(key_skills) if key_skills else 'my diverse skill set'
+        skills_text = ', '.join(key_skills) or _DEFAULT_RESUME_SKILLS_TEXT
 
         return f"I would welcome the opportunity to discuss how my experience and {skills_text} can contribute to {company_name}'s continued success. Thank you for considering my application, and I look forward to hearing from you soon."
 
-    def _generate_ai_opening(self, job_title: str, company_name: str, templates: Dict, user_background: Optional[str],
+    def _generate_ai_opening(self, job_title: str, company_name: str, templates: Dict,
                              key_skills: Optional[List[str]]) -> str:
         """Generate AI opening paragraph"""
         template = templates["opening_templates"][0]  # Use first template for simplicity
 
-        # Simple template variable replacement
-        relevant_field = self._infer_field_from_job_title(job_title)
-
-        return template.format(
-            job_title=job_title,
-            company_name=company_name,
-            relevant_field=relevant_field,
-            years_experience="several",
-            industry=self._infer_industry_from_job_title(job_title),
-            key_qualification=key_skills[0] if key_skills else "strong qualifications"
+        return self._render_ai_opening(
+            template,
+            job_title,
+            company_name,
+            key_skills[0] if key_skills else "strong qualifications"
         )
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _render_ai_opening(template: str, job_title: str, company_name: str, key_qualification: str) -> str:
+        """Render an opening template; cached since drafts are regenerated for the same job"""
+        # Simple template variable replacement
+        relevant_field, industry = CoverLetterAIService._classify_job_title(job_title)
+
+        return template.format_map({
+            'job_title': job_title,
+            'company_name': company_name,
+            'relevant_field': relevant_field,
+            'years_experience': "several",
+            'industry': industry,
+            'key_qualification': key_qualification
+        })
+
     def _generate_ai_body(self, job_title: str, company_name: str, job_description: Optional[str],
-                          user_background: Optional[str], key_skills: Optional[List[str]], templates: Dict) -> List[
-        str]:
+                          user_background: Optional[str], key_skills: Optional[List[str]]) -> List[str]:
         """Generate AI body paragraphs"""
-        paragraphs = []
+        # Adjacent f-string fragments below are joined by the compiler into one BUILD_STRING,
+        # so splitting a paragraph across lines costs nothing at runtime.
 
         # Experience paragraph
         if user_background:
-            paragraphs.append(
+            experience_paragraph = (
                 f"My background in {user_background} has equipped me with the skills necessary for the {job_title} role. "
                 f"I am particularly excited about the opportunity to apply my expertise at {company_name} and contribute to your team's success."
             )
         else:
             skills_text = ', '.join(key_skills[:3]) if key_skills else 'diverse professional skills'
-            paragraphs.append(
+            experience_paragraph = (
                 f"Throughout my career, I have developed strong expertise in {skills_text}. "
                 f"I am drawn to {company_name} because of your commitment to excellence and innovation in the industry."
             )
 
         # Skills and motivation paragraph
         motivation_text = "making a meaningful impact" if not job_description else "contributing to the specific goals outlined in your job posting"
-        paragraphs.append(
+        motivation_paragraph = (
             f"What excites me most about this opportunity is the chance to combine my technical skills with my passion for {motivation_text}. "
             f"I believe my proactive approach and commitment to continuous learning would make me a valuable addition to your {job_title} team."
         )
 
-        return paragraphs
+        # Always exactly two paragraphs, so build the list in one go
+        return [experience_paragraph, motivation_paragraph]
 
-    def _generate_ai_closing(self, job_title: str, company_name: str, templates: Dict,
+    def _generate_ai_closing(self, job_title: str, company_name: str,
                              key_skills: Optional[List[str]]) -> str:
         """Generate AI closing paragraph"""
         expertise = ', '.join(key_skills[:2]) if key_skills else 'my experience'
 
         return f"I would be thrilled to discuss how my {expertise} can contribute to {company_name}'s continued growth and success. Thank you for your time and consideration, and I look forward to the opportunity to speak with you further about the {job_title} position."
 
-    def _infer_field_from_job_title(self, job_title: str) -> str:
-        """Infer relevant field from job title"""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _classify_job_title(job_title: str) -> Tuple[str, str]:
+        """Infer relevant field and industry from job title, lowercasing it once for both"""
         job_lower = job_title.lower()
 
-        if any(term in job_lower for term in ['engineer', 'developer', 'programmer', 'software']):
-            return "software development"
-        elif any(term in job_lower for term in ['manager', 'director', 'lead']):
-            return "leadership and management"
-        elif any(term in job_lower for term in ['analyst', 'data', 'research']):
-            return "data analysis"
-        elif any(term in job_lower for term in ['marketing', 'sales', 'business']):
-            return "business development"
-        elif any(term in job_lower for term in ['design', 'creative', 'ui', 'ux']):
-            return "design and user experience"
-        else:
-            return "the relevant field"
+        return (
+            CoverLetterAIService._infer_field_from_job_title(job_lower),
+            CoverLetterAIService._infer_industry_from_job_title(job_lower)
+        )
 
-    def _infer_industry_from_job_title(self, job_title: str) -> str:
-        """Infer industry from job title"""
-        job_lower = job_title.lower()
+    @staticmethod
+    def _infer_field_from_job_title(job_lower: str) -> str:
+        """Infer relevant field from a lowercased job title"""
+        for pattern, field in _FIELD_PATTERNS:
+            if pattern.search(job_lower):
+                return field
+        return "the relevant field"
 
-        if any(term in job_lower for term in ['software', 'tech', 'engineer', 'developer']):
-            return "technology"
-        elif any(term in job_lower for term in ['healthcare', 'medical', 'nurse', 'doctor']):
-            return "healthcare"
-        elif any(term in job_lower for term in ['finance', 'accounting', 'bank']):
-            return "finance"
-        elif any(term in job_lower for term in ['education', 'teacher', 'professor']):
-            return "education"
-        elif any(term in job_lower for term in ['marketing', 'advertising', 'brand']):
-            return "marketing"
-        else:
-            return "your industry"
\ No newline at end of file
+    @staticmethod
+    def _infer_industry_from_job_title(job_lower: str) -> str:
+        """Infer industry from a lowercased job title"""
+        for pattern, industry in _INDUSTRY_PATTERNS:
+            if pattern.search(job_lower):
+                return industry
+        return "your industry"
+
+
+# Shared service instances; none of them are bound to a request Session
+_VALIDATION_SERVICE = CoverLetterValidationService()
+
+
+@lru_cache(maxsize=1)
+def _get_ai_service() -> CoverLetterAIService:
+    """Create the AI service on first generate_* call instead of at import"""
+    return CoverLetterAIService()
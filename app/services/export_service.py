@@ -1,44 +1,108 @@
-from typing import Dict, Any, Optional
-from io import BytesIO
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from io import BytesIO, SEEK_END
 import logging
+import re
 import uuid
 from datetime import datetime, timedelta
 import asyncio
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import threading
 import weakref
-import gc
+import hashlib
+import heapq
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+import orjson
 
 from app.utils.pdf_generator import ResumePDFGenerator
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# PDF rendering runs here instead of on the request path; jobs start as 'pending' and
+# clients poll the export status endpoint until they complete or fail
+_export_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="export")
+
+
+def _log_export_task_failure(future: Future) -> None:
+    """Log exceptions that escaped an export task's own error handling, which would otherwise
+    vanish with its future"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Unhandled error in export task", exc_info=future.exception())
+
+# Export format catalogue, built once and read-only; get_supported_formats hands API callers
+# plain copies since pydantic cannot serialize mappingproxy
+_SUPPORTED_FORMATS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'pdf': MappingProxyType({
+        'name': 'PDF Document',
+        'description': 'Portable Document Format suitable for printing and sharing',
+        'extension': '.pdf',
+        'mime_type': 'application/pdf',
+        'max_size_mb': 10,
+        'supported': True
+    }),
+    'docx': MappingProxyType({
+        'name': 'Word Document',
+        'description': 'Microsoft Word document format',
+        'extension': '.docx',
+        'mime_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'max_size_mb': 10,
+        'supported': False  # Not yet implemented
+    }),
+    'html': MappingProxyType({
+        'name': 'HTML Document',
+        'description': 'Web-ready HTML format',
+        'extension': '.html',
+        'mime_type': 'text/html',
+        'max_size_mb': 5,
+        'supported': False  # Not yet implemented
+    })
+})
+
+# Formats that can actually be exported today
+_ACTIVE_FORMATS = frozenset(
+    export_format for export_format, format_info in _SUPPORTED_FORMATS.items() if format_info['supported']
+)
+
+# Characters not allowed in stored filenames, and whitespace runs collapsed to one underscore
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_MAX_CONTENT_SIZE = 1024 * 1024  # 1MB resume content limit
+
 
 class ExportService:
     """Service for exporting resumes to various formats with improved memory management"""
 
     def __init__(self):
         self.pdf_generator = ResumePDFGenerator()
-        self.export_cache = {}  # In production, use Redis
+        self.export_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # Job metadata, least recently used first
+        self.file_cache: Dict[str, bytes] = {}  # Exported file content by export ID
+        self._expiry_heap: List[Tuple[datetime, str]] = []  # (expires_at, export_id), soonest first
+        self.user_exports: Dict[str, Dict[str, None]] = defaultdict(dict)  # User ID -> export IDs, oldest first
+        self.rendered_cache: "OrderedDict[str, bytes]" = OrderedDict()  # Rendered PDFs by input hash
+        self.max_rendered_cache_size = 50
+        self.max_rendered_cache_bytes = 50 * 1024 * 1024  # PDFs vary widely in size, so bound total bytes too
+        self._rendered_cache_bytes = 0
+        self._render_candidates: "OrderedDict[str, None]" = OrderedDict()  # Input hashes rendered once
         self.cache_lock = threading.RLock()  # Use RLock for nested locking
         self.max_cache_size = 100  # Maximum number of cached files
         self.max_file_size = 10 * 1024 * 1024  # 10MB max file size
         self._cleanup_thread = None
+        self._stop_cleanup = threading.Event()
         self._start_cleanup_thread()
 
     def _start_cleanup_thread(self):
         """Start background cleanup thread"""
 
         def cleanup_worker():
-            import time
-            while True:
+            # The wait returns early, ending the loop, once shutdown() sets the event
+            while not self._stop_cleanup.wait(self._cleanup_interval()):
                 try:
-                    time.sleep(300)  # Run every 5 minutes
                     self.cleanup_expired_jobs()
                     self._cleanup_cache_if_needed()
-                    # Force garbage collection
-                    gc.collect()
                 except Exception as e:
                     logger.error(f"Cleanup thread error: {e}")
 
@@ -46,6 +110,16 @@ class ExportService:
             self._cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
             self._cleanup_thread.start()
 
+    def _cleanup_interval(self) -> int:
+        """Seconds until the next cleanup pass: sooner while the cache is over 80% full"""
+        return 60 if len(self.export_cache) > self.max_cache_size * 0.8 else 300
+
+    def shutdown(self):
+        """Stop the background cleanup thread"""
+        self._stop_cleanup.set()
+        if self._cleanup_thread and self._cleanup_thread.is_alive():
+            self._cleanup_thread.join(timeout=5)
+
     def export_to_pdf(
             self,
             resume_content: Dict[str, Any],
@@ -86,8 +160,9 @@ class ExportService:
                 logger.error(f"PDF generation failed: {pdf_error}")
                 raise ValueError(f"PDF generation failed: {str(pdf_error)}")
 
-            # Validate generated PDF size
-            pdf_size = len(pdf_buffer.getvalue())
+            # Validate generated PDF size from the stream end rather than copying it with getvalue()
+            pdf_size = pdf_buffer.seek(0, SEEK_END)
+            pdf_buffer.seek(0)
             if pdf_size > self.max_file_size:
                 pdf_buffer.close()  # Clean up memory
                 raise ValueError(f"Generated PDF size ({pdf_size} bytes) exceeds maximum allowed size")
@@ -121,7 +196,7 @@ class ExportService:
             if not user_id:
                 raise ValueError("User ID is required for export job")
 
-            if export_format not in self.get_supported_formats():
+            if export_format not in _SUPPORTED_FORMATS:
                 raise ValueError(f"Unsupported export format: {export_format}")
 
             # Validate resume content early
@@ -129,14 +204,15 @@ class ExportService:
             if not is_valid:
                 raise ValueError(error_msg)
 
+            created_at = datetime.utcnow()
             job_data = {
                 'export_id': export_id,
                 'user_id': user_id,
                 'resume_title': self._sanitize_filename(title),
                 'export_format': export_format,
                 'status': 'pending',
-                'created_at': datetime.utcnow(),
-                'expires_at': datetime.utcnow() + timedelta(hours=24),
+                'created_at': created_at,
+                'expires_at': created_at + timedelta(hours=24),
                 'download_url': None,
                 'file_size': None,
                 'error_message': None,
@@ -145,14 +221,20 @@ class ExportService:
 
             # Store job in cache with thread safety
             with self.cache_lock:
-                # Clean cache if it's getting too large
-                self._cleanup_cache_if_needed()
+                # Drop jobs that are past due first, so the size cap only ever evicts live ones;
+                # with nothing expired this is a single heap peek
+                self.cleanup_expired_jobs()
                 self.export_cache[export_id] = job_data.copy()
+                self.user_exports[user_id][export_id] = None
+                heapq.heappush(self._expiry_heap, (job_data['expires_at'], export_id))
+                # Evict least recently used jobs if the cache is now too large
+                self._cleanup_cache_if_needed()
 
             # Process export based on format
             try:
                 if export_format == 'pdf':
-                    self._process_pdf_export(export_id, resume_content, title)
+                    future = _export_executor.submit(self._process_pdf_export, export_id, resume_content, title)
+                    future.add_done_callback(_log_export_task_failure)
                 elif export_format == 'docx':
                     job_data.update({
                         'status': 'failed',
@@ -182,10 +264,11 @@ class ExportService:
                     'progress': 0
                 })
 
-            # Update job data in cache
-            with self.cache_lock:
-                if export_id in self.export_cache:
-                    self.export_cache[export_id].update(job_data)
+            # Record failures in cache; a submitted PDF job updates its own entry as it runs
+            if job_data['status'] == 'failed':
+                with self.cache_lock:
+                    if export_id in self.export_cache:
+                        self.export_cache[export_id].update(job_data)
 
             logger.info(f"Created export job: {export_id} with status: {job_data['status']}")
             return job_data
@@ -207,16 +290,43 @@ class ExportService:
                 self.export_cache[export_id]['status'] = 'processing'
                 self.export_cache[export_id]['progress'] = 25
 
-            # Generate PDF
-            pdf_buffer = self.export_to_pdf(resume_content, title)
-            file_content = pdf_buffer.getvalue()
+            # Reuse the PDF from an earlier export of the same content and title
+            render_key = self._hash_export_input(resume_content, title)
+            with self.cache_lock:
+                file_content = self.rendered_cache.get(render_key)
+                if file_content is not None:
+                    self.rendered_cache.move_to_end(render_key)
 
-            # Close buffer to free memory
-            pdf_buffer.close()
+            if file_content is None:
+                # Generate PDF
+                pdf_buffer = self.export_to_pdf(resume_content, title)
+                file_content = pdf_buffer.getvalue()
+
+                # Close buffer to free memory
+                pdf_buffer.close()
 
-            # Validate file size
-            if len(file_content) > self.max_file_size:
-                raise ValueError("Generated file exceeds size limit")
+                # Validate file size
+                if len(file_content) > self.max_file_size:
+                    raise ValueError("Generated file exceeds size limit")
+
+                with self.cache_lock:
+                    # Admit a render only when its input has been exported before, so one-off
+                    # exports don't evict PDFs that keep being re-exported
+                    if render_key in self._render_candidates:
+                        del self._render_candidates[render_key]
+                        previous = self.rendered_cache.pop(render_key, None)
+                        if previous is not None:
+                            self._rendered_cache_bytes -= len(previous)
+                        self.rendered_cache[render_key] = file_content
+                        self._rendered_cache_bytes += len(file_content)
+                        while (len(self.rendered_cache) > self.max_rendered_cache_size
+                               or self._rendered_cache_bytes > self.max_rendered_cache_bytes):
+                            _, evicted = self.rendered_cache.popitem(last=False)
+                            self._rendered_cache_bytes -= len(evicted)
+                    else:
+                        self._render_candidates[render_key] = None
+                        while len(self._render_candidates) > self.max_rendered_cache_size * 4:
+                            self._render_candidates.popitem(last=False)
 
             with self.cache_lock:
                 if export_id in self.export_cache:
@@ -228,9 +338,7 @@ class ExportService:
                         'progress': 100
                     })
 
-                    # Store the file content with weak reference for memory management
-                    content_key = f"{export_id}_content"
-                    self.export_cache[content_key] = file_content
+                    self.file_cache[export_id] = file_content
 
         except Exception as e:
             logger.error(f"PDF export processing failed for {export_id}: {e}")
@@ -242,7 +350,17 @@ class ExportService:
                         'completed_at': datetime.utcnow(),
                         'progress': 0
                     })
-            raise
+            # Not re-raised: the failure is logged and recorded on the job, and nothing awaits this task
+
+    def _hash_export_input(self, resume_content: Dict[str, Any], title: str) -> str:
+        """Build a stable cache key for the inputs that determine a rendered PDF"""
+        # Same options as the size check in validate_export_request, so content that validates always hashes
+        serialized = orjson.dumps(
+            [title, resume_content],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.blake2b(serialized, digest_size=16).hexdigest()
 
     def get_export_status(self, export_id: str) -> Optional[Dict[str, Any]]:
         """Get the status of an export job with improved error handling"""
@@ -252,6 +370,8 @@ class ExportService:
 
             with self.cache_lock:
                 job_data = self.export_cache.get(export_id)
+                if job_data:
+                    self.export_cache.move_to_end(export_id)
 
             if not job_data:
                 logger.debug(f"Export job not found: {export_id}")
@@ -285,9 +405,8 @@ class ExportService:
                 return None
 
             # Get file content from cache
-            content_key = f"{export_id}_content"
             with self.cache_lock:
-                file_content = self.export_cache.get(content_key)
+                file_content = self.file_cache.get(export_id)
 
             if not file_content:
                 logger.error(f"Export file content not found for job {export_id}")
@@ -310,16 +429,11 @@ class ExportService:
                 return False
 
             with self.cache_lock:
-                # Remove job data
-                job_removed = export_id in self.export_cache
+                job_data = self.export_cache.pop(export_id, None)
+                job_removed = job_data is not None
                 if job_removed:
-                    del self.export_cache[export_id]
-
-                # Remove file content
-                content_key = f"{export_id}_content"
-                content_removed = content_key in self.export_cache
-                if content_removed:
-                    del self.export_cache[content_key]
+                    self._unindex_user_export(export_id, job_data)
+                content_removed = self.file_cache.pop(export_id, None) is not None
 
             if job_removed or content_removed:
                 logger.debug(f"Cleaned up export job: {export_id}")
@@ -332,6 +446,15 @@ class ExportService:
             logger.error(f"Error cleaning up export job {export_id}: {e}")
             return False
 
+    def _unindex_user_export(self, export_id: str, job_data: Dict[str, Any]):
+        """Drop a removed job from its user's export index; call with cache_lock held"""
+        user_id = job_data.get('user_id')
+        user_jobs = self.user_exports.get(user_id)
+        if user_jobs is not None:
+            user_jobs.pop(export_id, None)
+            if not user_jobs:
+                del self.user_exports[user_id]
+
     def cleanup_expired_jobs(self) -> int:
         """Clean up all expired export jobs with improved error handling"""
         try:
@@ -339,17 +462,12 @@ class ExportService:
             expired_jobs = []
 
             with self.cache_lock:
-                # Find expired jobs
-                for export_id, job_data in list(self.export_cache.items()):
-                    if (isinstance(job_data, dict) and
-                            'expires_at' in job_data and
-                            not export_id.endswith('_content')):
-                        try:
-                            if current_time > job_data['expires_at']:
-                                expired_jobs.append(export_id)
-                        except Exception as e:
-                            logger.error(f"Error checking expiration for job {export_id}: {e}")
-                            expired_jobs.append(export_id)  # Clean up problematic entries
+                # Pop only the jobs that have expired; entries for jobs already evicted or
+                # deleted are skipped here rather than searched for on removal
+                while self._expiry_heap and current_time > self._expiry_heap[0][0]:
+                    _, export_id = heapq.heappop(self._expiry_heap)
+                    if export_id in self.export_cache:
+                        expired_jobs.append(export_id)
 
             # Clean up expired jobs
             cleaned_count = 0
@@ -370,42 +488,18 @@ class ExportService:
             return 0
 
     def _cleanup_cache_if_needed(self):
-        """Clean up cache if it exceeds maximum size with improved logic"""
+        """Evict least recently used jobs while the cache exceeds its maximum size"""
         try:
-            current_cache_size = len(self.export_cache)
-            if current_cache_size <= self.max_cache_size:
-                return
-
-            # Calculate how many entries to remove (remove 30% of oldest)
-            jobs_to_remove = max(1, int(current_cache_size * 0.3))
-
-            # Find oldest jobs to remove
-            current_time = datetime.utcnow()
-            job_ages = []
-
-            for key, data in list(self.export_cache.items()):
-                if (isinstance(data, dict) and
-                        'created_at' in data and
-                        not key.endswith('_content')):
-                    try:
-                        age = (current_time - data['created_at']).total_seconds()
-                        job_ages.append((age, key))
-                    except Exception as e:
-                        logger.error(f"Error calculating age for job {key}: {e}")
-                        job_ages.append((float('inf'), key))  # Mark for removal
-
-            # Sort by age (oldest first) and remove oldest jobs
-            job_ages.sort(reverse=True)
-
             removed_count = 0
-            for _, export_id in job_ages[:jobs_to_remove]:
-                try:
-                    if self.cleanup_export_job(export_id):
-                        removed_count += 1
-                except Exception as e:
-                    logger.error(f"Error removing old job {export_id}: {e}")
+            with self.cache_lock:
+                while len(self.export_cache) > self.max_cache_size:
+                    export_id, job_data = self.export_cache.popitem(last=False)
+                    self._unindex_user_export(export_id, job_data)
+                    self.file_cache.pop(export_id, None)
+                    removed_count += 1
 
-            logger.info(f"Cache cleanup removed {removed_count} old export jobs")
+            if removed_count:
+                logger.info(f"Cache cleanup removed {removed_count} least recently used export jobs")
 
         except Exception as e:
             logger.error(f"Error during cache cleanup: {e}")
@@ -416,41 +510,15 @@ class ExportService:
             return "resume"
 
         # Remove or replace problematic characters
-        import re
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename.strip())
-        sanitized = re.sub(r'\s+', '_', sanitized)
+        sanitized = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename.strip())
+        sanitized = _WHITESPACE_RE.sub('_', sanitized)
         sanitized = sanitized[:100]  # Limit length
 
         return sanitized if sanitized else "resume"
 
     def get_supported_formats(self) -> Dict[str, Dict[str, Any]]:
         """Get list of supported export formats"""
-        return {
-            'pdf': {
-                'name': 'PDF Document',
-                'description': 'Portable Document Format suitable for printing and sharing',
-                'extension': '.pdf',
-                'mime_type': 'application/pdf',
-                'max_size_mb': 10,
-                'supported': True
-            },
-            'docx': {
-                'name': 'Word Document',
-                'description': 'Microsoft Word document format',
-                'extension': '.docx',
-                'mime_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                'max_size_mb': 10,
-                'supported': False  # Not yet implemented
-            },
-            'html': {
-                'name': 'HTML Document',
-                'description': 'Web-ready HTML format',
-                'extension': '.html',
-                'mime_type': 'text/html',
-                'max_size_mb': 5,
-                'supported': False  # Not yet implemented
-            }
-        }
+        return {export_format: dict(format_info) for export_format, format_info in _SUPPORTED_FORMATS.items()}
 
     def validate_export_request(
             self,
@@ -460,12 +528,10 @@ class ExportService:
         """Validate export request with comprehensive checks"""
         try:
             # Check if format is supported
-            supported_formats = self.get_supported_formats()
-            if export_format not in supported_formats:
+            if export_format not in _SUPPORTED_FORMATS:
                 return False, f"Unsupported export format: {export_format}"
 
-            format_info = supported_formats[export_format]
-            if not format_info.get('supported', False):
+            if export_format not in _ACTIVE_FORMATS:
                 return False, f"Export format '{export_format}' is not yet implemented"
 
             # Check if resume content is valid
@@ -490,11 +556,10 @@ class ExportService:
             if missing_fields:
                 return False, f"Personal information missing required fields: {', '.join(missing_fields)}"
 
-            # Check content size (rough estimate)
+            # Check content size as serialized JSON
             try:
-                content_str = str(resume_content)
-                content_size = len(content_str.encode('utf-8'))
-                if content_size > 1024 * 1024:  # 1MB content limit
+                content_size = len(orjson.dumps(resume_content, default=str, option=orjson.OPT_NON_STR_KEYS))
+                if content_size > _MAX_CONTENT_SIZE:
                     return False, "Resume content is too large"
             except Exception as e:
                 logger.warning(f"Could not estimate content size: {e}")
@@ -516,29 +581,24 @@ class ExportService:
                 user_jobs = 0
                 total_file_size = 0
 
-                for key, job_data in self.export_cache.items():
+                for export_id, job_data in self.export_cache.items():
                     try:
-                        # Skip content entries
-                        if key.endswith('_content'):
-                            if isinstance(job_data, bytes):
-                                total_file_size += len(job_data)
-                            continue
-
-                        if isinstance(job_data, dict) and 'status' in job_data:
-                            total_jobs += 1
-
-                            if user_id and job_data.get('user_id') == user_id:
-                                user_jobs += 1
-
-                            status = job_data['status']
-                            if status == 'completed':
-                                completed_jobs += 1
-                            elif status == 'failed':
-                                failed_jobs += 1
-                            elif status in ['pending', 'processing']:
-                                pending_jobs += 1
+                        total_jobs += 1
+
+                        if user_id and job_data.get('user_id') == user_id:
+                            user_jobs += 1
+
+                        status = job_data['status']
+                        if status == 'completed':
+                            completed_jobs += 1
+                        elif status == 'failed':
+                            failed_jobs += 1
+                        elif status in ['pending', 'processing']:
+                            pending_jobs += 1
                     except Exception as e:
-                        logger.error(f"Error processing statistics for key {key}: {e}")
+                        logger.error(f"Error processing statistics for job {export_id}: {e}")
+
+                total_file_size = sum(len(file_content) for file_content in self.file_cache.values())
 
             stats = {
                 'total_jobs': total_jobs,
@@ -576,35 +636,23 @@ class ExportService:
             user_exports = []
 
             with self.cache_lock:
-                for export_id, job_data in self.export_cache.items():
-                    try:
-                        if (isinstance(job_data, dict) and
-                                'user_id' in job_data and
-                                job_data['user_id'] == user_id and
-                                not export_id.endswith('_content')):
-                            export_entry = {
-                                'export_id': export_id,
-                                'resume_title': job_data.get('resume_title'),
-                                'export_format': job_data.get('export_format'),
-                                'status': job_data.get('status'),
-                                'created_at': job_data.get('created_at'),
-                                'file_size': job_data.get('file_size'),
-                                'download_url': job_data.get('download_url')
-                            }
-                            user_exports.append(export_entry)
-                    except Exception as e:
-                        logger.error(f"Error processing export entry {export_id}: {e}")
-
-            # Sort by creation date (newest first) and limit
-            try:
-                user_exports.sort(
-                    key=lambda x: x.get('created_at', datetime.min),
-                    reverse=True
-                )
-            except Exception as e:
-                logger.error(f"Error sorting export history: {e}")
+                # The index holds the user's jobs in creation order, so walk it newest first
+                for export_id in reversed(self.user_exports.get(user_id, {})):
+                    if len(user_exports) >= limit:
+                        break
+
+                    job_data = self.export_cache[export_id]
+                    user_exports.append({
+                        'export_id': export_id,
+                        'resume_title': job_data.get('resume_title'),
+                        'export_format': job_data.get('export_format'),
+                        'status': job_data.get('status'),
+                        'created_at': job_data.get('created_at'),
+                        'file_size': job_data.get('file_size'),
+                        'download_url': job_data.get('download_url')
+                    })
 
-            return user_exports[:limit]
+            return user_exports
 
         except Exception as e:
             logger.error(f"Error getting user export history: {e}")
@@ -613,8 +661,22 @@ class ExportService:
     def __del__(self):
         """Cleanup when service is destroyed"""
         try:
-            if hasattr(self, '_cleanup_thread') and self._cleanup_thread:
-                # Note: We can't join the thread here as it's daemon
-                pass
+            if hasattr(self, '_stop_cleanup'):
+                self._stop_cleanup.set()
         except Exception as e:
-            logger.error(f"Error in ExportService destructor: {e}")
\ No newline at end of file
+            logger.error(f"Error in ExportService destructor: {e}")
+
+
+@lru_cache(maxsize=1)
+def get_export_service() -> ExportService:
+    """Process-wide export service, so the request that creates a job and the ones that poll
+    and download it share one job cache and one cleanup thread"""
+    return ExportService()
+
+
+def shutdown_export_service():
+    """Stop the export worker pool and the shared export service's cleanup thread"""
+    # Queued renders are dropped; ones already running finish in the background
+    _export_executor.shutdown(wait=False, cancel_futures=True)
+    if get_export_service.cache_info().currsize:
+        get_export_service().shutdown()
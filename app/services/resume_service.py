@@ -5,7 +5,7 @@ import logging
 
 from app.repositories.resume_repository import ResumeRepository
 from app.services.validation_service import ValidationService
-from app.services.export_service import ExportService
+from app.services.export_service import get_export_service
 from app.services.template_service import TemplateService
 from app.schemas.resume import (
     ResumeCreate, ResumeUpdate, ResumeResponse, ResumeListItem,
@@ -22,7 +22,7 @@ class ResumeService:
     def __init__(self, db: Session):
         self.repository = ResumeRepository(db)
         self.validation_service = ValidationService()
-        self.export_service = ExportService()
+        self.export_service = get_export_service()
         self.template_service = TemplateService()
         self.db = db
 
@@ -258,13 +258,14 @@ class ResumePDFGenerator:
             # Build PDF
             try:
                 doc.build(story)
-                buffer.seek(0)
+                pdf_size = buffer.tell()
 
                 # Validate generated PDF
-                if buffer.tell() == 0:
+                if pdf_size == 0:
                     raise ValueError("Generated PDF is empty")
 
-                logger.info(f"Successfully generated PDF for resume: {title} ({buffer.tell()} bytes)")
+                buffer.seek(0)
+                logger.info(f"Successfully generated PDF for resume: {title} ({pdf_size} bytes)")
                 return buffer
 
             except Exception as e: